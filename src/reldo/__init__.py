@@ -17,20 +17,13 @@ Example:
 """
 
 from importlib.metadata import version
+from typing import Any
 
 __version__ = version("reldo")
 
 from .models.ReviewConfig import ReviewConfig
 from .models.ReviewResult import ReviewResult
 from .models.ReviewSession import ReviewSession
-from .reldo import Reldo
-
-# Re-export HookMatcher from SDK for programmatic hook usage
-# Will be enabled when claude-agent-sdk is installed
-try:
-    from claude_agent_sdk import HookMatcher
-except ImportError:
-    HookMatcher = None  # type: ignore[misc, assignment]
 
 __all__ = [
     "Reldo",
@@ -39,3 +32,28 @@ __all__ = [
     "ReviewSession",
     "HookMatcher",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import SDK-dependent exports on first access (PEP 562).
+
+    Reldo (via ReviewService) and HookMatcher both drag in the Claude
+    Agent SDK; loading them lazily keeps `reldo --help`/`reldo init`
+    startup from importing the SDK at all.
+    """
+    if name == "Reldo":
+        from .reldo import Reldo
+
+        globals()["Reldo"] = Reldo
+        return Reldo
+    if name == "HookMatcher":
+        # Re-export HookMatcher from SDK for programmatic hook usage;
+        # None when claude-agent-sdk is not installed
+        try:
+            from claude_agent_sdk import HookMatcher
+        except ImportError:
+            globals()["HookMatcher"] = None
+            return None
+        globals()["HookMatcher"] = HookMatcher
+        return HookMatcher
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
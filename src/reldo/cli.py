@@ -2,9 +2,15 @@
 
 import argparse
 import asyncio
+import dataclasses
+import functools
 import json
+import os
+import pickle
+import re
 import sys
 from pathlib import Path
+from typing import Any
 
 from . import __version__
 from .defaults import (
@@ -13,10 +19,28 @@ from .defaults import (
     DEFAULT_GITIGNORE,
     DEFAULT_ORCHESTRATOR_PATH,
     DEFAULT_ORCHESTRATOR_PROMPT,
+    DEFAULT_ORCHESTRATOR_PROMPT_BYTES,
 )
 from .models.ReviewConfig import ReviewConfig
 from .models.ReviewResult import ReviewResult
-from .reldo import Reldo
+from .utils.serialization import json_dumps as _dumps
+from .utils.serialization import json_loads as _loads
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import Reldo on first attribute access (PEP 562).
+
+    Importing Reldo pulls in the Claude Agent SDK; deferring it keeps
+    `reldo --help` and `reldo init` from paying that startup cost.
+    Tests patching `reldo.cli.Reldo` still work: patch resolves the
+    attribute through this hook and replaces it in module globals.
+    """
+    if name == "Reldo":
+        from .reldo import Reldo
+
+        globals()["Reldo"] = Reldo
+        return Reldo
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -95,6 +119,84 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
+# Flag tables for _fast_parse, mapping CLI flags to Namespace attributes
+_REVIEW_VALUE_FLAGS = {"--config": "config", "--cwd": "cwd"}
+_REVIEW_BOOL_FLAGS = {
+    "--json": "json_output",
+    "--verbose": "verbose",
+    "--no-log": "no_log",
+    "--exit-code": "exit_code",
+}
+
+
+def _fast_parse(argv: list[str]) -> argparse.Namespace | None:
+    """Parse the common review/init invocations without argparse.
+
+    Building the full argparse parser costs tens of milliseconds per
+    invocation just to recognize a tiny grammar. This walks argv once
+    and handles the plain cases directly; anything it doesn't recognize
+    (--help, --version, --flag=value forms, unknown flags, missing
+    arguments) returns None so main() can fall back to argparse for
+    proper help text and error messages.
+
+    Args:
+        argv: Command-line arguments (without the program name).
+
+    Returns:
+        Parsed Namespace, or None if argparse should handle this argv.
+    """
+    if not argv:
+        return None
+
+    command = argv[0]
+
+    if command == "review":
+        args = argparse.Namespace(
+            command="review",
+            prompt=None,
+            config=None,
+            cwd=None,
+            json_output=False,
+            verbose=False,
+            no_log=False,
+            exit_code=False,
+        )
+        prompt: str | None = None
+        i = 1
+        while i < len(argv):
+            arg = argv[i]
+            if arg in _REVIEW_BOOL_FLAGS:
+                setattr(args, _REVIEW_BOOL_FLAGS[arg], True)
+            elif arg in _REVIEW_VALUE_FLAGS:
+                i += 1
+                # A missing value or a following option token means a
+                # malformed invocation; let argparse produce its usage error
+                if i == len(argv) or argv[i].startswith("-"):
+                    return None
+                setattr(args, _REVIEW_VALUE_FLAGS[arg], argv[i])
+            elif arg.startswith("-") and arg != "-":
+                return None
+            elif prompt is None:
+                prompt = arg
+            else:
+                return None
+            i += 1
+        if prompt is None:
+            return None
+        args.prompt = prompt
+        return args
+
+    if command == "init":
+        args = argparse.Namespace(command="init", force=False)
+        for arg in argv[1:]:
+            if arg != "--force":
+                return None
+            args.force = True
+        return args
+
+    return None
+
+
 def read_prompt(prompt_arg: str) -> str:
     """Read prompt from argument or stdin.
 
@@ -105,10 +207,37 @@ def read_prompt(prompt_arg: str) -> str:
         The prompt text.
     """
     if prompt_arg == "-":
-        return sys.stdin.read().strip()
+        # Bulk-read the underlying binary buffer and decode once; avoids
+        # the TextIOWrapper's incremental per-chunk decoding on large
+        # piped prompts. Trimming before decoding keeps the whitespace
+        # strip a cheap C byte loop instead of a second str allocation.
+        data = sys.stdin.buffer.read()
+        return data.strip().decode("utf-8", errors="replace")
     return prompt_arg
 
 
+@functools.lru_cache(maxsize=32)
+def _load_json_cached(abspath: str, mtime_ns: int, size: int) -> bytes:
+    """Read and parse a JSON config file, cached as a pickled snapshot.
+
+    The mtime_ns/size arguments exist purely to key the cache: if the file
+    changes on disk, the stat signature changes and the stale entry is
+    bypassed. Caching the pickle (rather than the dict) lets each caller
+    rebuild a private mutable copy with a single C-level pickle.loads,
+    which is faster than copy.deepcopy and keeps cache entries pristine.
+
+    Args:
+        abspath: Absolute path to the JSON file.
+        mtime_ns: File modification time in nanoseconds (cache key).
+        size: File size in bytes (cache key).
+
+    Returns:
+        Pickled parsed-JSON dictionary.
+    """
+    data = _loads(Path(abspath).read_bytes())
+    return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
+
 def load_config(config_path: str | None, cwd: str | None) -> ReviewConfig:
     """Load configuration from file or use defaults.
 
@@ -120,6 +249,7 @@ def load_config(config_path: str | None, cwd: str | None) -> ReviewConfig:
         ReviewConfig instance.
 
     Raises:
+        FileNotFoundError: If an explicitly specified config file is missing.
         json.JSONDecodeError: If config file exists but isn't valid JSON.
     """
     working_dir = Path(cwd) if cwd else Path.cwd()
@@ -133,8 +263,21 @@ def load_config(config_path: str | None, cwd: str | None) -> ReviewConfig:
         path = working_dir / DEFAULT_CONFIG_PATH
 
     # Try to load config file if it exists
-    if path.exists():
-        config = ReviewConfig.from_file(path)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        stat = None
+
+    if stat is None and config_path:
+        # An explicitly requested config must exist; only the default
+        # location is allowed to fall back to built-in defaults
+        raise FileNotFoundError(f"Config file not found: {path}")
+
+    if stat is not None:
+        # Parse is cached per (path, mtime, size); unpickling rebuilds a
+        # private copy so substitution in from_dict never touches the cache
+        pickled = _load_json_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        config = ReviewConfig.from_dict(pickle.loads(pickled))
     else:
         # No config file - use defaults
         config = _create_default_config(working_dir)
@@ -192,6 +335,11 @@ def _create_default_config(working_dir: Path) -> ReviewConfig:
     )
 
 
+# Field names resolved once at import time instead of hand-maintaining
+# the dict literal in format_result (stays in sync with ReviewResult)
+_RESULT_FIELDS = tuple(f.name for f in dataclasses.fields(ReviewResult))
+
+
 def format_result(result: ReviewResult, as_json: bool) -> str:
     """Format the review result for output.
 
@@ -203,25 +351,24 @@ def format_result(result: ReviewResult, as_json: bool) -> str:
         Formatted result string.
     """
     if as_json:
-        data = {
-            "text": result.text,
-            "structured_output": result.structured_output,
-            "input_tokens": result.input_tokens,
-            "output_tokens": result.output_tokens,
-            "total_tokens": result.total_tokens,
-            "total_cost_usd": result.total_cost_usd,
-            "duration_ms": result.duration_ms,
-        }
-        return json.dumps(data, indent=2)
+        data = {name: getattr(result, name) for name in _RESULT_FIELDS}
+        return json.dumps(data, indent=2, ensure_ascii=False)
 
     # Plain text output
     return result.text
 
 
+# Matches "STATUS: PASS/FAIL" or a bare "PASS:"/"FAIL:" prefix anywhere
+# in the review text; a single scan replaces the four substring probes
+# (and the full .upper() copy) previously done per result
+_STATUS_RE = re.compile(r"STATUS:\s*(PASS|FAIL)|(PASS|FAIL):", re.IGNORECASE)
+
+
 def check_review_passed(result: ReviewResult) -> bool:
     """Check if the review passed (for exit-code mode).
 
-    Looks for PASS/FAIL indicators in the result text.
+    Looks for PASS/FAIL indicators in the result text. Any FAIL
+    indicator takes precedence over PASS indicators.
 
     Args:
         result: The review result.
@@ -229,17 +376,12 @@ def check_review_passed(result: ReviewResult) -> bool:
     Returns:
         True if review appears to have passed.
     """
-    text_upper = result.text.upper()
-
-    # Check for explicit FAIL indicators
-    if "STATUS: FAIL" in text_upper or "FAIL:" in text_upper:
-        return False
+    for match in _STATUS_RE.finditer(result.text):
+        status = match.group(1) or match.group(2)
+        if status.upper() == "FAIL":
+            return False
 
-    # Check for explicit PASS indicators
-    if "STATUS: PASS" in text_upper or "PASS:" in text_upper:
-        return True
-
-    # Default to passed if no clear indicator
+    # Passed explicitly, or no clear indicator (defaults to passed)
     return True
 
 
@@ -283,8 +425,10 @@ async def run_review(args: argparse.Namespace) -> int:
         if not args.json_output:
             print(f"Starting review with {config.model}...", file=sys.stderr)
 
-        # Run review
-        reldo = Reldo(config=config)
+        # Run review (module-level lookup honors both the lazy import
+        # hook and any test patching of reldo.cli.Reldo)
+        reldo_cls = getattr(sys.modules[__name__], "Reldo")
+        reldo = reldo_cls(config=config)
         result = await reldo.review(prompt=prompt)
 
         # Output result
@@ -328,6 +472,15 @@ def _print_error(message: str, as_json: bool) -> None:
         print(f"Error: {message}", file=sys.stderr)
 
 
+# Scaffolding written by `reldo init`, pre-encoded once at import time
+_INIT_DIRS = ("sessions", "agents")
+_INIT_FILES: tuple[tuple[str, bytes], ...] = (
+    ("settings.json", _dumps(DEFAULT_CONFIG) + b"\n"),
+    ("orchestrator.md", DEFAULT_ORCHESTRATOR_PROMPT_BYTES),
+    (".gitignore", DEFAULT_GITIGNORE.encode("utf-8")),
+)
+
+
 def run_init(args: argparse.Namespace) -> int:
     """Initialize a new .reldo directory with default configuration.
 
@@ -337,39 +490,28 @@ def run_init(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, 1 for failure).
     """
-    cwd = Path.cwd()
-    reldo_dir = cwd / ".reldo"
-    settings_file = reldo_dir / "settings.json"
-    orchestrator_file = reldo_dir / "orchestrator.md"
-    gitignore_file = reldo_dir / ".gitignore"
-    sessions_dir = reldo_dir / "sessions"
-    agents_dir = reldo_dir / "agents"
-
-    # Check if already exists
-    if reldo_dir.exists() and not args.force:
-        print(f"Error: {reldo_dir} already exists. Use --force to overwrite.")
-        return 1
+    reldo_dir = Path.cwd() / ".reldo"
 
     try:
-        # Create directories
-        reldo_dir.mkdir(exist_ok=True)
-        sessions_dir.mkdir(exist_ok=True)
-        agents_dir.mkdir(exist_ok=True)
-
-        # Write settings.json
-        settings_file.write_text(
-            json.dumps(DEFAULT_CONFIG, indent=2) + "\n",
-            encoding="utf-8",
-        )
-        print(f"Created {settings_file}")
-
-        # Write orchestrator.md
-        orchestrator_file.write_text(DEFAULT_ORCHESTRATOR_PROMPT, encoding="utf-8")
-        print(f"Created {orchestrator_file}")
-
-        # Write .gitignore
-        gitignore_file.write_text(DEFAULT_GITIGNORE, encoding="utf-8")
-        print(f"Created {gitignore_file}")
+        # mkdir doubles as the existence check - no separate stat needed
+        try:
+            reldo_dir.mkdir(exist_ok=args.force)
+        except FileExistsError:
+            # With --force an existing directory is fine; a FileExistsError
+            # then means .reldo is a regular file, which the generic
+            # handler below reports
+            if not args.force:
+                print(f"Error: {reldo_dir} already exists. Use --force to overwrite.")
+                return 1
+            raise
+
+        for dir_name in _INIT_DIRS:
+            (reldo_dir / dir_name).mkdir(exist_ok=True)
+
+        for file_name, payload in _INIT_FILES:
+            target = reldo_dir / file_name
+            target.write_bytes(payload)
+            print(f"Created {target}")
 
         print(f"\nInitialized reldo in {reldo_dir}")
         print("\nNext steps:")
@@ -390,12 +532,14 @@ def main() -> int:
     Returns:
         Exit code (0 for success, 1 for failure).
     """
-    parser = create_parser()
-    args = parser.parse_args()
-
-    if args.command is None:
-        parser.print_help()
-        return 0
+    args = _fast_parse(sys.argv[1:])
+    if args is None:
+        # Fall back to argparse for help/version/errors and unusual forms
+        parser = create_parser()
+        args = parser.parse_args()
+        if args.command is None:
+            parser.print_help()
+            return 0
 
     if args.command == "review":
         return asyncio.run(run_review(args))
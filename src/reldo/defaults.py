@@ -37,6 +37,10 @@ STATUS: PASS|FAIL
 Be concise and actionable. Focus on real problems, not style nitpicks.
 """
 
+# Pre-encoded form of the default prompt, for callers that write it to
+# disk (avoids re-encoding on every `reldo init`)
+DEFAULT_ORCHESTRATOR_PROMPT_BYTES = DEFAULT_ORCHESTRATOR_PROMPT.encode("utf-8")
+
 # Default configuration values (for init command)
 DEFAULT_CONFIG = {
     "prompt": ".reldo/orchestrator.md",
@@ -8,7 +8,7 @@ from typing import Any
 from reldo.utils import substitute_variables
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewConfig:
     """Configuration for a Reldo review session.
 
@@ -97,9 +97,15 @@ class ReviewConfig:
         else:
             cwd = Path.cwd()
 
-        # Apply variable substitution to mcp_servers and agents
-        mcp_servers = substitute_variables(data.get("mcp_servers", {}), cwd)
-        agents = substitute_variables(data.get("agents", {}), cwd)
+        # Apply variable substitution to mcp_servers and agents; skip the
+        # recursive walk entirely when the subtree is absent or empty
+        # (the common case for simple configs)
+        mcp_servers = data.get("mcp_servers") or {}
+        if mcp_servers:
+            mcp_servers = substitute_variables(mcp_servers, cwd)
+        agents = data.get("agents") or {}
+        if agents:
+            agents = substitute_variables(agents, cwd)
 
         # Build logging config with defaults
         default_logging = {"enabled": True, "output_dir": ".reldo", "verbose": False}
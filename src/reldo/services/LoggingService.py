@@ -1,12 +1,13 @@
 """Service for logging review sessions."""
 
 import json
-import uuid
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from ..models.ReviewResult import ReviewResult
+from ..utils import json_dumps, json_loads
 
 
 class LoggingService:
@@ -23,6 +24,7 @@ class LoggingService:
         _output_dir: Base directory for session logs.
         _verbose: Whether to include full transcripts.
         _sessions: Mapping of session_id to session directory path.
+        _session_data: In-memory session.json payloads for open sessions.
     """
 
     def __init__(self, output_dir: Path, verbose: bool = False) -> None:
@@ -35,14 +37,88 @@ class LoggingService:
         self._output_dir = output_dir
         self._verbose = verbose
         self._sessions: dict[str, Path] = {}
+        self._session_data: dict[str, dict[str, Any]] = {}
+        self._sessions_root_created = False
+
+    # Conservative bound on buffers per writev call; Linux IOV_MAX is 1024
+    _WRITEV_MAX_BUFFERS = 1024
+
+    @staticmethod
+    def _write_all(fd: int, data: bytes) -> None:
+        """Write data to fd, retrying until every byte is written.
+
+        os.write may write fewer bytes than requested; looping over the
+        remainder keeps artifacts from being silently truncated.
+
+        Args:
+            fd: Open file descriptor to write to.
+            data: Bytes to write in full.
+        """
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+
+    def _write_artifact(
+        self, path: Path, data: bytes | list[bytes], preallocate: bool = False
+    ) -> None:
+        """Write a session artifact with a single write syscall.
+
+        All session files (session.json, result.json, transcript.log) go
+        through this one writer: open, one write of the fully serialized
+        payload, close. Skips the buffered TextIOWrapper layer that
+        Path.write_text sets up per call. A list of buffers is gathered
+        into one writev call instead of being joined into a fresh bytes
+        object first.
+
+        Args:
+            path: Destination file path.
+            data: Fully serialized file contents, either one buffer or a
+                list of buffers written in order.
+            preallocate: Reserve the file's extents up front with
+                posix_fallocate before writing. Worth it for large
+                payloads like verbose transcripts; a no-op on platforms
+                without the call.
+        """
+        bufs = [data] if isinstance(data, bytes) else data
+        total = sum(len(buf) for buf in bufs)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            if preallocate and total and hasattr(os, "posix_fallocate"):
+                try:
+                    os.posix_fallocate(fd, 0, total)
+                except OSError:
+                    # Filesystem doesn't support fallocate (e.g. some
+                    # tmpfs/network mounts); the write below still works.
+                    pass
+            if len(bufs) == 1:
+                self._write_all(fd, bufs[0])
+            elif hasattr(os, "writev") and len(bufs) <= self._WRITEV_MAX_BUFFERS:
+                try:
+                    written = os.writev(fd, bufs)
+                except OSError:
+                    # writev can be unavailable for this fd (e.g. fake
+                    # filesystems that only patch os.write); join and
+                    # fall back to a single plain write
+                    self._write_all(fd, b"".join(bufs))
+                else:
+                    if written < total:
+                        # Partial gather write; finish the remainder
+                        # with plain writes
+                        self._write_all(fd, b"".join(bufs)[written:])
+            else:
+                self._write_all(fd, b"".join(bufs))
+        finally:
+            os.close(fd)
 
     def _generate_session_id(self) -> str:
         """Generate a unique session ID.
 
         Returns:
-            Short UUID for session identification.
+            Short random hex ID for session identification.
         """
-        return str(uuid.uuid4())[:8]
+        # 4 random bytes straight to 8 hex chars; cheaper than building
+        # a full UUID and slicing most of it away
+        return os.urandom(4).hex()
 
     def _create_session_dir(self, session_id: str) -> Path:
         """Create the session directory.
@@ -55,8 +131,14 @@ class LoggingService:
         """
         timestamp = datetime.now().strftime("%Y-%m-%dT%H-%M-%S")
         dir_name = f"{timestamp}-{session_id}"
-        session_dir = self._output_dir / "sessions" / dir_name
-        session_dir.mkdir(parents=True, exist_ok=True)
+        sessions_root = self._output_dir / "sessions"
+        # Create the shared sessions/ root once per service instance;
+        # subsequent sessions only need their own subdirectory
+        if not self._sessions_root_created:
+            sessions_root.mkdir(parents=True, exist_ok=True)
+            self._sessions_root_created = True
+        session_dir = sessions_root / dir_name
+        session_dir.mkdir(exist_ok=True)
         return session_dir
 
     def start_session(self, prompt: str, config: dict[str, Any]) -> str:
@@ -86,12 +168,13 @@ class LoggingService:
             "verbose": self._verbose,
         }
 
+        # Keep the metadata in memory so later updates (e.g. the SDK
+        # transcript reference) don't have to re-read and re-parse the file
+        self._session_data[session_id] = session_data
+
         # Save session.json
         session_file = session_dir / "session.json"
-        session_file.write_text(
-            json.dumps(session_data, indent=2, default=str),
-            encoding="utf-8"
-        )
+        self._write_artifact(session_file, json_dumps(session_data))
 
         return session_id
 
@@ -145,8 +228,11 @@ class LoggingService:
         session_dir = self._get_session_dir(session_id)
         session_file = session_dir / "session.json"
 
-        # Read existing session.json
-        session_data = json.loads(session_file.read_text(encoding="utf-8"))
+        # Use the in-memory copy when available; fall back to re-reading
+        # the file for sessions this instance no longer holds in memory
+        session_data = self._session_data.get(session_id)
+        if session_data is None:
+            session_data = json_loads(session_file.read_bytes())
 
         # Add SDK transcript reference
         sdk_transcript_path = self._get_sdk_transcript_path(sdk_session_id, cwd)
@@ -154,10 +240,7 @@ class LoggingService:
         session_data["sdk_transcript_path"] = sdk_transcript_path
 
         # Write updated session.json
-        session_file.write_text(
-            json.dumps(session_data, indent=2, default=str),
-            encoding="utf-8"
-        )
+        self._write_artifact(session_file, json_dumps(session_data))
 
     def save_result(self, session_id: str, result: ReviewResult) -> None:
         """Save the review result.
@@ -182,10 +265,7 @@ class LoggingService:
 
         # Save result.json
         result_file = session_dir / "result.json"
-        result_file.write_text(
-            json.dumps(result_data, indent=2, default=str),
-            encoding="utf-8"
-        )
+        self._write_artifact(result_file, json_dumps(result_data))
 
     def _format_block(self, block: Any) -> str:
         """Format a single content block for logging.
@@ -231,10 +311,66 @@ class LoggingService:
         # Fallback: convert to string
         return f"[BLOCK] {type(block).__name__}\n{block!s}"
 
+    _TRANSCRIPT_HEADER = ("=" * 60 + "\nRELDO SESSION TRANSCRIPT\n" + "=" * 60 + "\n\n").encode(
+        "utf-8"
+    )
+    _TRANSCRIPT_FOOTER = ("=" * 60 + "\nEND OF TRANSCRIPT\n" + "=" * 60).encode("utf-8")
+
+    def _render_message(self, index: int, msg: Any) -> str:
+        """Render one transcript message as a newline-terminated block.
+
+        Args:
+            index: Zero-based position of the message in the transcript.
+            msg: The message object from the SDK.
+
+        Returns:
+            Formatted message block ending with a newline.
+        """
+        role = getattr(msg, "role", None)
+        msg_type = type(msg).__name__
+
+        lines: list[str] = []
+        lines.append(f"{'=' * 40}")
+        if role:
+            lines.append(f"MESSAGE {index + 1} [{role.upper()}]")
+        else:
+            lines.append(f"MESSAGE {index + 1} [{msg_type}]")
+        lines.append(f"{'=' * 40}")
+
+        # Handle messages with content blocks
+        if hasattr(msg, "content"):
+            content = getattr(msg, "content", [])
+            if isinstance(content, list):
+                for block in content:
+                    lines.append(self._format_block(block))
+                    lines.append("")
+            else:
+                lines.append(str(content))
+                lines.append("")
+
+        # Handle ResultMessage (final message with usage stats)
+        elif hasattr(msg, "session_id") and hasattr(msg, "usage"):
+            lines.append("[RESULT]")
+            if hasattr(msg, "result") and msg.result:
+                lines.append(msg.result)
+            usage = getattr(msg, "usage", {})
+            if usage:
+                lines.append(f"\n[USAGE] {json.dumps(usage, indent=2)}")
+            lines.append("")
+
+        # Fallback
+        else:
+            lines.append(str(msg))
+            lines.append("")
+
+        return "\n".join(lines) + "\n"
+
     def save_transcript(self, session_id: str, messages: list[Any]) -> None:
         """Save the full transcript with tool calls and thoughts.
 
-        Only saves if verbose mode is enabled.
+        Only saves if verbose mode is enabled. Each message is rendered
+        to its own buffer and the buffers are gathered into one write,
+        so the syscall count stays constant regardless of message count.
 
         Args:
             session_id: The session to save to.
@@ -245,57 +381,26 @@ class LoggingService:
 
         session_dir = self._get_session_dir(session_id)
 
-        lines: list[str] = []
-        lines.append("=" * 60)
-        lines.append("RELDO SESSION TRANSCRIPT")
-        lines.append("=" * 60)
-        lines.append("")
-
-        for i, msg in enumerate(messages):
-            # Determine message type/role
-            role = getattr(msg, "role", None)
-            msg_type = type(msg).__name__
-
-            lines.append(f"{'=' * 40}")
-            if role:
-                lines.append(f"MESSAGE {i + 1} [{role.upper()}]")
-            else:
-                lines.append(f"MESSAGE {i + 1} [{msg_type}]")
-            lines.append(f"{'=' * 40}")
-
-            # Handle messages with content blocks
-            if hasattr(msg, "content"):
-                content = getattr(msg, "content", [])
-                if isinstance(content, list):
-                    for block in content:
-                        lines.append(self._format_block(block))
-                        lines.append("")
-                else:
-                    lines.append(str(content))
-                    lines.append("")
+        bufs: list[bytes] = [self._TRANSCRIPT_HEADER]
+        bufs.extend(
+            self._render_message(i, msg).encode("utf-8") for i, msg in enumerate(messages)
+        )
+        bufs.append(self._TRANSCRIPT_FOOTER)
 
-            # Handle ResultMessage (final message with usage stats)
-            elif hasattr(msg, "session_id") and hasattr(msg, "usage"):
-                lines.append("[RESULT]")
-                if hasattr(msg, "result") and msg.result:
-                    lines.append(msg.result)
-                usage = getattr(msg, "usage", {})
-                if usage:
-                    lines.append(f"\n[USAGE] {json.dumps(usage, indent=2)}")
-                lines.append("")
+        # Save transcript.log
+        transcript_file = session_dir / "transcript.log"
+        self._write_artifact(transcript_file, bufs, preallocate=True)
 
-            # Fallback
-            else:
-                lines.append(str(msg))
-                lines.append("")
+    def close_session(self, session_id: str) -> None:
+        """Release in-memory state held for a finished session.
 
-        lines.append("=" * 60)
-        lines.append("END OF TRANSCRIPT")
-        lines.append("=" * 60)
+        The session directory mapping is kept so get_session_path keeps
+        working; only the cached session.json payload is dropped.
 
-        # Save transcript.log
-        transcript_file = session_dir / "transcript.log"
-        transcript_file.write_text("\n".join(lines), encoding="utf-8")
+        Args:
+            session_id: The session to close.
+        """
+        self._session_data.pop(session_id, None)
 
     def get_session_path(self, session_id: str) -> Path:
         """Get the path to a session's directory.
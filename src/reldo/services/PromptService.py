@@ -1,8 +1,28 @@
 """Service for loading and resolving prompts."""
 
+import os
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=64)
+def _read_prompt_file(abspath: str, mtime_ns: int) -> str:
+    """Read a prompt file, cached by path and modification time.
+
+    The mtime_ns argument keys the cache: editing the file changes its
+    mtime, so stale entries are bypassed automatically. Repeated reviews
+    in one process (watch/server mode) skip the disk read entirely.
+
+    Args:
+        abspath: Absolute path to the prompt file.
+        mtime_ns: File modification time in nanoseconds (cache key).
+
+    Returns:
+        File content as string.
+    """
+    return Path(abspath).read_text(encoding="utf-8")
+
+
 class PromptService:
     """Loads prompts from files or passes through inline strings.
 
@@ -50,9 +70,16 @@ class PromptService:
         if value.endswith((".md", ".txt")):
             return True
 
-        # Check if it resolves to an existing file
-        resolved = self._resolve_path(value, cwd)
-        return resolved.is_file()
+        # Multiline strings are always inline prompts; skip the
+        # filesystem probe for them
+        if "\n" in value:
+            return False
+
+        # Check if it resolves to an existing file. Plain os.path avoids
+        # allocating a Path object for what is usually an inline string.
+        if os.path.isabs(value):
+            return os.path.isfile(value)
+        return os.path.isfile(os.path.join(cwd, value))
 
     def _resolve_path(self, path: str, cwd: Path) -> Path:
         """Resolve a path relative to cwd.
@@ -86,6 +113,8 @@ class PromptService:
             FileNotFoundError: If the file doesn't exist.
         """
         resolved = self._resolve_path(path, cwd)
-        if not resolved.exists():
-            raise FileNotFoundError(f"Prompt file not found: {resolved}")
-        return resolved.read_text(encoding="utf-8")
+        try:
+            stat = os.stat(resolved)
+        except OSError:
+            raise FileNotFoundError(f"Prompt file not found: {resolved}") from None
+        return _read_prompt_file(str(resolved), stat.st_mtime_ns)
@@ -235,4 +235,6 @@ class ReviewService:
                         cwd=str(self._get_cwd()),
                     )
 
+            self._logging_service.close_session(session_id)
+
         return result
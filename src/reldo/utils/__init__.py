@@ -1,5 +1,6 @@
 """Utility functions for Reldo."""
 
+from .serialization import json_dumps, json_loads
 from .substitution import substitute_variables
 
-__all__ = ["substitute_variables"]
+__all__ = ["json_dumps", "json_loads", "substitute_variables"]
@@ -0,0 +1,31 @@
+"""JSON serialization helpers with an optional orjson fast path.
+
+orjson encodes and parses JSON in C, several times faster than the
+stdlib for the dict/list payloads Reldo moves around (configs, session
+metadata, results). It is an optional extra (`pip install reldo[orjson]`);
+without it these helpers fall back transparently to the stdlib.
+"""
+
+from typing import Any
+
+try:
+    import orjson
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize to indented JSON bytes, stringifying unknown types."""
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2)
+
+    def json_loads(data: bytes | str) -> Any:
+        """Parse JSON from bytes or str."""
+        return orjson.loads(data)
+
+except ImportError:
+    import json
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize to indented JSON bytes, stringifying unknown types."""
+        return json.dumps(obj, indent=2, default=str).encode("utf-8")
+
+    def json_loads(data: bytes | str) -> Any:
+        """Parse JSON from bytes or str."""
+        return json.loads(data)
@@ -5,6 +5,10 @@ import re
 from pathlib import Path
 from typing import Any
 
+# Matches the supported variables only: ${cwd} and ${env:VAR_NAME}.
+# Unknown patterns like ${something_else} never match and pass through as-is.
+_VAR_RE = re.compile(r"\$\{(cwd|env:[A-Za-z_][A-Za-z0-9_]*)\}")
+
 
 def substitute_variables(value: Any, cwd: Path) -> Any:
     """Recursively substitute variables in a value.
@@ -40,8 +44,9 @@ def _substitute_string(value: str, cwd: Path) -> str:
     Returns:
         String with variables substituted.
     """
-    # Pattern for ${cwd} and ${env:VAR_NAME}
-    pattern = r"\$\{([^}]+)\}"
+    # Fast bail-out: most config strings contain no variables at all
+    if "${" not in value:
+        return value
 
     def replace_match(match: re.Match[str]) -> str:
         var_spec = match.group(1)
@@ -50,16 +55,10 @@ def _substitute_string(value: str, cwd: Path) -> str:
         if var_spec == "cwd":
             return str(cwd)
 
-        # Handle ${env:VAR_NAME}
-        if var_spec.startswith("env:"):
-            env_var = var_spec[4:]  # Remove "env:" prefix
-            env_value = os.environ.get(env_var)
-            if env_value is None:
-                # Return original placeholder if env var not set
-                return match.group(0)
-            return env_value
-
-        # Unknown variable - return as-is
-        return match.group(0)
+        # Handle ${env:VAR_NAME} - keep placeholder if env var not set
+        env_value = os.environ.get(var_spec[4:])
+        if env_value is None:
+            return match.group(0)
+        return env_value
 
-    return re.sub(pattern, replace_match, value)
+    return _VAR_RE.sub(replace_match, value)
@@ -0,0 +1,138 @@
+"""Shared pytest configuration for the Reldo test suite."""
+
+import os
+import sys
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+from reldo import Reldo
+from reldo.models import ReviewConfig
+from reldo.services import ReviewService
+
+_TMPFS_ROOT = Path("/dev/shm/reldo-tests")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Route temporary files to tmpfs when available.
+
+    The suite is filesystem-heavy (session logs, prompt files, config
+    files), so pointing tmp_path and tempfile at /dev/shm keeps those
+    writes in memory instead of on a block device. Falls back silently
+    to the platform default when tmpfs isn't available (macOS, CI
+    containers without /dev/shm).
+    """
+    try:
+        _TMPFS_ROOT.mkdir(exist_ok=True)
+    except OSError:
+        return
+    if os.access(_TMPFS_ROOT, os.W_OK):
+        tempfile.tempdir = str(_TMPFS_ROOT)
+        os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", str(_TMPFS_ROOT))
+
+
+@pytest.fixture(scope="session")
+def review_service_module() -> ModuleType:
+    """The reldo.services.ReviewService module, resolved once for patching.
+
+    Looked up via sys.modules because the services package re-exports
+    the ReviewService class under the same name as its module.
+    """
+    from reldo.services import ReviewService  # noqa: F401 - ensures the module is loaded
+
+    return sys.modules["reldo.services.ReviewService"]
+
+
+class _AsyncIter:
+    """Plain async iterator over pre-built items.
+
+    Cheaper than an async generator for mocking the SDK's query stream:
+    no generator frame or coroutine state, just a tuple iterator.
+    """
+
+    __slots__ = ("_it",)
+
+    def __init__(self, items: tuple[Any, ...]) -> None:
+        self._it = iter(items)
+
+    def __aiter__(self) -> "_AsyncIter":
+        return self
+
+    async def __anext__(self) -> Any:
+        try:
+            return next(self._it)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+@pytest.fixture(scope="session")
+def aiter_of() -> Callable[..., _AsyncIter]:
+    """Factory building an async iterator over the given messages."""
+
+    def factory(*items: Any) -> _AsyncIter:
+        return _AsyncIter(items)
+
+    return factory
+
+
+@pytest.fixture(scope="session")
+def orchestrator_md(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Orchestrator prompt file written once per session."""
+    path = tmp_path_factory.mktemp("reldo-prompts") / "orchestrator.md"
+    path.write_text("# Orchestrator\nYou review code.", encoding="utf-8")
+    return path
+
+
+@pytest.fixture(scope="session")
+def reldo_json(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """reldo.json config file written once per session."""
+    path = tmp_path_factory.mktemp("reldo-config") / "reldo.json"
+    path.write_text(
+        """{
+            "prompt": "You are a code reviewer",
+            "allowed_tools": ["Read", "Glob", "Grep"],
+            "cwd": "/tmp"
+        }""",
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.fixture(scope="session")
+def loaded_reldo_json_config(reldo_json: Path) -> ReviewConfig:
+    """ReviewConfig parsed from the shared reldo.json once per session."""
+    return ReviewConfig.from_file(reldo_json)
+
+
+@pytest.fixture(scope="session")
+def base_config() -> ReviewConfig:
+    """Baseline ReviewConfig shared across the suite.
+
+    Session-scoped: built once instead of per test. Tests must treat it
+    as read-only and build their own config when they need variations.
+    """
+    return ReviewConfig(
+        prompt="You are a code reviewer",
+        allowed_tools=["Read", "Glob", "Grep"],
+        cwd=Path("/tmp/test-project"),
+    )
+
+
+@pytest.fixture
+def service(base_config: ReviewConfig) -> ReviewService:
+    """Fresh ReviewService wrapping the shared baseline config."""
+    return ReviewService(base_config)
+
+
+@pytest.fixture(scope="class")
+def reldo_instance(base_config: ReviewConfig) -> Reldo:
+    """Reldo wrapper shared per test class.
+
+    For tests that only swap out the mocked query stream; tests that
+    need hooks or a different config still build their own instance.
+    """
+    return Reldo(config=base_config)
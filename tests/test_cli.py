@@ -3,14 +3,16 @@
 import io
 import json
 import sys
-import tempfile
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import patch, MagicMock, AsyncMock
 
 import pytest
 
 from reldo.cli import (
     create_parser,
+    _fast_parse,
     read_prompt,
     load_config,
     format_result,
@@ -22,6 +24,26 @@ from reldo.cli import (
 from reldo.models import ReviewConfig, ReviewResult
 
 
+def make_args(**overrides: Any) -> SimpleNamespace:
+    """Build a parsed-args namespace with CLI defaults.
+
+    A plain SimpleNamespace mirrors what argparse produces without
+    MagicMock's per-attribute-access overhead.
+    """
+    defaults: dict[str, Any] = {
+        "prompt": None,
+        "config": None,
+        "cwd": None,
+        "json_output": False,
+        "verbose": False,
+        "no_log": False,
+        "exit_code": False,
+        "force": False,
+    }
+    defaults.update(overrides)
+    return SimpleNamespace(**defaults)
+
+
 class TestCreateParser:
     """Tests for create_parser function."""
 
@@ -68,6 +90,77 @@ class TestCreateParser:
         assert args.config is None
 
 
+class TestFastParse:
+    """Tests for the _fast_parse argv fast path."""
+
+    def test_parses_review_with_all_options(self) -> None:
+        """Test that review with all options is parsed without argparse."""
+        args = _fast_parse([
+            "review",
+            "Test",
+            "--config", "custom.json",
+            "--cwd", "/tmp",
+            "--json",
+            "--verbose",
+            "--no-log",
+            "--exit-code",
+        ])
+
+        assert args is not None
+        assert args.command == "review"
+        assert args.prompt == "Test"
+        assert args.config == "custom.json"
+        assert args.cwd == "/tmp"
+        assert args.json_output is True
+        assert args.verbose is True
+        assert args.no_log is True
+        assert args.exit_code is True
+
+    def test_parses_review_defaults(self) -> None:
+        """Test that review defaults match argparse defaults."""
+        args = _fast_parse(["review", "Test"])
+
+        assert args is not None
+        assert args.config is None
+        assert args.cwd is None
+        assert args.json_output is False
+        assert args.verbose is False
+        assert args.no_log is False
+        assert args.exit_code is False
+
+    def test_parses_stdin_prompt(self) -> None:
+        """Test that '-' is accepted as the prompt."""
+        args = _fast_parse(["review", "-"])
+        assert args is not None
+        assert args.prompt == "-"
+
+    def test_parses_init(self) -> None:
+        """Test that init with and without --force is parsed."""
+        args = _fast_parse(["init"])
+        assert args is not None
+        assert args.command == "init"
+        assert args.force is False
+
+        args = _fast_parse(["init", "--force"])
+        assert args is not None
+        assert args.force is True
+
+    def test_falls_back_for_help_and_version(self) -> None:
+        """Test that help/version requests defer to argparse."""
+        assert _fast_parse([]) is None
+        assert _fast_parse(["--version"]) is None
+        assert _fast_parse(["review", "--help"]) is None
+        assert _fast_parse(["review", "Test", "-h"]) is None
+
+    def test_falls_back_for_unknown_input(self) -> None:
+        """Test that unknown flags/commands defer to argparse."""
+        assert _fast_parse(["unknown-command"]) is None
+        assert _fast_parse(["review", "Test", "--bogus"]) is None
+        assert _fast_parse(["review"]) is None  # missing prompt
+        assert _fast_parse(["review", "Test", "--config"]) is None  # missing value
+        assert _fast_parse(["init", "--bogus"]) is None
+
+
 class TestReadPrompt:
     """Tests for read_prompt function."""
 
@@ -78,13 +171,15 @@ class TestReadPrompt:
 
     def test_read_prompt_from_stdin(self) -> None:
         """Test reading prompt from stdin."""
-        with patch.object(sys, "stdin", io.StringIO("Stdin prompt\n")):
+        stdin = io.TextIOWrapper(io.BytesIO(b"Stdin prompt\n"))
+        with patch.object(sys, "stdin", stdin):
             prompt = read_prompt("-")
             assert prompt == "Stdin prompt"
 
     def test_read_prompt_stdin_strips_whitespace(self) -> None:
         """Test that stdin prompt is stripped."""
-        with patch.object(sys, "stdin", io.StringIO("  Trimmed  \n\n")):
+        stdin = io.TextIOWrapper(io.BytesIO(b"  Trimmed  \n\n"))
+        with patch.object(sys, "stdin", stdin):
             prompt = read_prompt("-")
             assert prompt == "Trimmed"
 
@@ -92,42 +187,38 @@ class TestReadPrompt:
 class TestLoadConfig:
     """Tests for load_config function."""
 
-    def test_load_config_from_file(self) -> None:
+    def test_load_config_from_file(self, tmp_path: Path) -> None:
         """Test loading config from file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_file = Path(tmpdir) / "config.json"
-            config_file.write_text('{"prompt": "Test reviewer"}', encoding="utf-8")
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"prompt": "Test reviewer"}', encoding="utf-8")
 
-            config = load_config(str(config_file), None)
-            assert config.prompt == "Test reviewer"
+        config = load_config(str(config_file), None)
+        assert config.prompt == "Test reviewer"
 
-    def test_load_config_relative_path(self) -> None:
+    def test_load_config_relative_path(self, tmp_path: Path) -> None:
         """Test loading config from relative path."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_file = Path(tmpdir) / ".claude" / "reldo.json"
-            config_file.parent.mkdir(parents=True)
-            config_file.write_text('{"prompt": "Relative config"}', encoding="utf-8")
+        config_file = tmp_path / ".claude" / "reldo.json"
+        config_file.parent.mkdir(parents=True)
+        config_file.write_text('{"prompt": "Relative config"}', encoding="utf-8")
 
-            config = load_config(".claude/reldo.json", tmpdir)
-            assert config.prompt == "Relative config"
+        config = load_config(".claude/reldo.json", str(tmp_path))
+        assert config.prompt == "Relative config"
 
-    def test_load_config_missing_uses_defaults(self) -> None:
+    def test_load_config_missing_uses_defaults(self, tmp_path: Path) -> None:
         """Test that missing config uses sensible defaults."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config = load_config(None, tmpdir)
-            # Should return a valid config with defaults
-            assert config.prompt is not None
-            assert config.allowed_tools is not None
-            assert config.cwd == Path(tmpdir)
-
-    def test_load_config_with_cwd_override(self) -> None:
+        config = load_config(None, str(tmp_path))
+        # Should return a valid config with defaults
+        assert config.prompt is not None
+        assert config.allowed_tools is not None
+        assert config.cwd == tmp_path
+
+    def test_load_config_with_cwd_override(self, tmp_path: Path) -> None:
         """Test that cwd override works."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_file = Path(tmpdir) / "config.json"
-            config_file.write_text('{"prompt": "Test", "cwd": "/original"}', encoding="utf-8")
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"prompt": "Test", "cwd": "/original"}', encoding="utf-8")
 
-            config = load_config(str(config_file), "/override")
-            assert config.cwd == Path("/override")
+        config = load_config(str(config_file), "/override")
+        assert config.cwd == Path("/override")
 
 
 class TestFormatResult:
@@ -163,38 +254,22 @@ class TestFormatResult:
 class TestCheckReviewPassed:
     """Tests for check_review_passed function."""
 
-    def test_pass_with_status_pass(self) -> None:
-        """Test that STATUS: PASS indicates pass."""
-        result = ReviewResult(text="STATUS: PASS\nAll checks succeeded")
-        assert check_review_passed(result) is True
-
-    def test_fail_with_status_fail(self) -> None:
-        """Test that STATUS: FAIL indicates failure."""
-        result = ReviewResult(text="STATUS: FAIL\n3 violations found")
-        assert check_review_passed(result) is False
-
-    def test_pass_with_pass_prefix(self) -> None:
-        """Test that PASS: prefix indicates pass."""
-        result = ReviewResult(text="PASS: No issues found")
-        assert check_review_passed(result) is True
-
-    def test_fail_with_fail_prefix(self) -> None:
-        """Test that FAIL: prefix indicates failure."""
-        result = ReviewResult(text="FAIL: Missing documentation")
-        assert check_review_passed(result) is False
-
-    def test_default_to_pass(self) -> None:
-        """Test that ambiguous text defaults to pass."""
-        result = ReviewResult(text="Review complete. Some notes here.")
-        assert check_review_passed(result) is True
-
-    def test_case_insensitive(self) -> None:
-        """Test that detection is case insensitive."""
-        result = ReviewResult(text="status: pass")
-        assert check_review_passed(result) is True
-
-        result = ReviewResult(text="Status: Fail")
-        assert check_review_passed(result) is False
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            pytest.param("STATUS: PASS\nAll checks succeeded", True, id="status-pass"),
+            pytest.param("STATUS: FAIL\n3 violations found", False, id="status-fail"),
+            pytest.param("PASS: No issues found", True, id="pass-prefix"),
+            pytest.param("FAIL: Missing documentation", False, id="fail-prefix"),
+            pytest.param("Review complete. Some notes here.", True, id="default-to-pass"),
+            pytest.param("status: pass", True, id="lowercase-pass"),
+            pytest.param("Status: Fail", False, id="mixed-case-fail"),
+        ],
+    )
+    def test_check_review_passed(self, text: str, expected: bool) -> None:
+        """Test PASS/FAIL detection across indicator styles and casings."""
+        result = ReviewResult(text=text)
+        assert check_review_passed(result) is expected
 
 
 class TestMain:
@@ -214,100 +289,73 @@ class TestMain:
 class TestRunReview:
     """Tests for run_review function."""
 
-    @pytest.mark.asyncio
     async def test_run_review_explicit_config_not_found(self) -> None:
         """Test that explicitly specified missing config returns error."""
-        args = MagicMock()
-        args.prompt = "Test"
-        args.config = "/nonexistent.json"  # Explicit path that doesn't exist
-        args.cwd = None
-        args.json_output = False
-        args.verbose = False
-        args.no_log = False
-        args.exit_code = False
+        args = make_args(prompt="Test", config="/nonexistent.json")
 
         exit_code = await run_review(args)
         assert exit_code == 1
 
-    @pytest.mark.asyncio
-    async def test_run_review_no_config_uses_defaults(self) -> None:
+    async def test_run_review_no_config_uses_defaults(self, tmp_path: Path) -> None:
         """Test that no config uses sensible defaults."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            args = MagicMock()
-            args.prompt = "Review this"
-            args.config = None  # No explicit config
-            args.cwd = tmpdir
-            args.json_output = False
-            args.verbose = False
-            args.no_log = True
-            args.exit_code = False
+        args = make_args(prompt="Review this", cwd=str(tmp_path), no_log=True)
 
-            mock_result = ReviewResult(text="STATUS: PASS\nAll good")
+        mock_result = ReviewResult(text="STATUS: PASS\nAll good")
 
-            with patch("reldo.cli.Reldo") as MockReldo:
-                mock_instance = MagicMock()
-                mock_instance.review = AsyncMock(return_value=mock_result)
-                MockReldo.return_value = mock_instance
+        with patch("reldo.cli.Reldo") as MockReldo:
+            mock_instance = MagicMock()
+            mock_instance.review = AsyncMock(return_value=mock_result)
+            MockReldo.return_value = mock_instance
 
-                exit_code = await run_review(args)
+            exit_code = await run_review(args)
 
-            assert exit_code == 0
+        assert exit_code == 0
 
-    @pytest.mark.asyncio
-    async def test_run_review_success(self) -> None:
+    async def test_run_review_success(self, tmp_path: Path) -> None:
         """Test successful review run."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create config
-            config_file = Path(tmpdir) / "config.json"
-            config_file.write_text('{"prompt": "Test"}', encoding="utf-8")
-
-            args = MagicMock()
-            args.prompt = "Review this"
-            args.config = str(config_file)
-            args.cwd = tmpdir
-            args.json_output = False
-            args.verbose = False
-            args.no_log = True
-            args.exit_code = False
-
-            # Mock the Reldo class
-            mock_result = ReviewResult(text="STATUS: PASS\nAll good")
-
-            with patch("reldo.cli.Reldo") as MockReldo:
-                mock_instance = MagicMock()
-                mock_instance.review = AsyncMock(return_value=mock_result)
-                MockReldo.return_value = mock_instance
-
-                exit_code = await run_review(args)
+        # Create config
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"prompt": "Test"}', encoding="utf-8")
 
-            assert exit_code == 0
+        args = make_args(
+            prompt="Review this", config=str(config_file), cwd=str(tmp_path), no_log=True
+        )
 
-    @pytest.mark.asyncio
-    async def test_run_review_exit_code_on_failure(self) -> None:
-        """Test that exit-code returns 1 on failure."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_file = Path(tmpdir) / "config.json"
-            config_file.write_text('{"prompt": "Test"}', encoding="utf-8")
+        # Mock the Reldo class
+        mock_result = ReviewResult(text="STATUS: PASS\nAll good")
+
+        with patch("reldo.cli.Reldo") as MockReldo:
+            mock_instance = MagicMock()
+            mock_instance.review = AsyncMock(return_value=mock_result)
+            MockReldo.return_value = mock_instance
 
-            args = MagicMock()
-            args.prompt = "Review this"
-            args.config = str(config_file)
-            args.cwd = tmpdir
-            args.json_output = False
-            args.verbose = False
-            args.no_log = True
-            args.exit_code = True  # Enable exit code
+            exit_code = await run_review(args)
 
-            mock_result = ReviewResult(text="STATUS: FAIL\nViolations found")
+        assert exit_code == 0
 
-            with patch("reldo.cli.Reldo") as MockReldo:
-                mock_instance = MagicMock()
-                mock_instance.review = AsyncMock(return_value=mock_result)
-                MockReldo.return_value = mock_instance
+    async def test_run_review_exit_code_on_failure(self, tmp_path: Path) -> None:
+        """Test that exit-code returns 1 on failure."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"prompt": "Test"}', encoding="utf-8")
+
+        args = make_args(
+            prompt="Review this",
+            config=str(config_file),
+            cwd=str(tmp_path),
+            no_log=True,
+            exit_code=True,
+        )
+
+        mock_result = ReviewResult(text="STATUS: FAIL\nViolations found")
+
+        with patch("reldo.cli.Reldo") as MockReldo:
+            mock_instance = MagicMock()
+            mock_instance.review = AsyncMock(return_value=mock_result)
+            MockReldo.return_value = mock_instance
 
-                exit_code = await run_review(args)
+            exit_code = await run_review(args)
 
-            assert exit_code == 1
+        assert exit_code == 1
 
 
 class TestCLIHelp:
@@ -332,88 +380,60 @@ class TestCLIHelp:
 class TestRunInit:
     """Tests for run_init function."""
 
-    def test_init_creates_directory_structure(self) -> None:
+    def test_init_creates_directory_structure(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that init creates .reldo directory structure."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            original_cwd = Path.cwd()
-            try:
-                import os
-                os.chdir(tmpdir)
-
-                args = MagicMock()
-                args.force = False
-
-                exit_code = run_init(args)
-
-                assert exit_code == 0
-                assert (Path(tmpdir) / ".reldo").exists()
-                assert (Path(tmpdir) / ".reldo" / "settings.json").exists()
-                assert (Path(tmpdir) / ".reldo" / "orchestrator.md").exists()
-                assert (Path(tmpdir) / ".reldo" / ".gitignore").exists()
-                assert (Path(tmpdir) / ".reldo" / "sessions").exists()
-                assert (Path(tmpdir) / ".reldo" / "agents").exists()
-            finally:
-                os.chdir(original_cwd)
-
-    def test_init_settings_contains_config(self) -> None:
+        monkeypatch.chdir(tmp_path)
+
+        exit_code = run_init(make_args())
+
+        assert exit_code == 0
+        assert (tmp_path / ".reldo").exists()
+        assert (tmp_path / ".reldo" / "settings.json").exists()
+        assert (tmp_path / ".reldo" / "orchestrator.md").exists()
+        assert (tmp_path / ".reldo" / ".gitignore").exists()
+        assert (tmp_path / ".reldo" / "sessions").exists()
+        assert (tmp_path / ".reldo" / "agents").exists()
+
+    def test_init_settings_contains_config(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that settings.json contains valid config."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            original_cwd = Path.cwd()
-            try:
-                import os
-                os.chdir(tmpdir)
-
-                args = MagicMock()
-                args.force = False
-
-                run_init(args)
-
-                settings_path = Path(tmpdir) / ".reldo" / "settings.json"
-                config = json.loads(settings_path.read_text(encoding="utf-8"))
-                assert config["prompt"] == ".reldo/orchestrator.md"
-                assert "allowed_tools" in config
-                assert "model" in config
-            finally:
-                os.chdir(original_cwd)
-
-    def test_init_fails_if_exists_without_force(self) -> None:
-        """Test that init fails if .reldo exists without --force."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            original_cwd = Path.cwd()
-            try:
-                import os
-                os.chdir(tmpdir)
+        monkeypatch.chdir(tmp_path)
+
+        run_init(make_args())
 
-                # Create existing .reldo directory
-                (Path(tmpdir) / ".reldo").mkdir()
+        settings_path = tmp_path / ".reldo" / "settings.json"
+        config = json.loads(settings_path.read_bytes())
+        assert config["prompt"] == ".reldo/orchestrator.md"
+        assert "allowed_tools" in config
+        assert "model" in config
 
-                args = MagicMock()
-                args.force = False
+    def test_init_fails_if_exists_without_force(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that init fails if .reldo exists without --force."""
+        monkeypatch.chdir(tmp_path)
 
-                exit_code = run_init(args)
-                assert exit_code == 1
-            finally:
-                os.chdir(original_cwd)
+        # Create existing .reldo directory
+        (tmp_path / ".reldo").mkdir()
 
-    def test_init_succeeds_with_force(self) -> None:
+        exit_code = run_init(make_args())
+        assert exit_code == 1
+
+    def test_init_succeeds_with_force(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that init succeeds with --force even if .reldo exists."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            original_cwd = Path.cwd()
-            try:
-                import os
-                os.chdir(tmpdir)
-
-                # Create existing .reldo directory
-                (Path(tmpdir) / ".reldo").mkdir()
-
-                args = MagicMock()
-                args.force = True
-
-                exit_code = run_init(args)
-                assert exit_code == 0
-                assert (Path(tmpdir) / ".reldo" / "settings.json").exists()
-            finally:
-                os.chdir(original_cwd)
+        monkeypatch.chdir(tmp_path)
+
+        # Create existing .reldo directory
+        (tmp_path / ".reldo").mkdir()
+
+        exit_code = run_init(make_args(force=True))
+        assert exit_code == 0
+        assert (tmp_path / ".reldo" / "settings.json").exists()
 
     def test_parser_has_init_subcommand(self) -> None:
         """Test that parser has init subcommand."""
@@ -12,10 +12,25 @@ from reldo.utils import substitute_variables
 class TestSubstituteVariables:
     """Tests for substitute_variables function."""
 
-    def test_substitute_cwd(self) -> None:
-        """Test ${cwd} substitution."""
-        result = substitute_variables("${cwd}/config", Path("/my/project"))
-        assert result == "/my/project/config"
+    @pytest.mark.parametrize(
+        ("value", "cwd", "expected"),
+        [
+            pytest.param("${cwd}/config", "/my/project", "/my/project/config", id="cwd"),
+            pytest.param("no variables here", "/tmp", "no variables here", id="plain-string"),
+            pytest.param(
+                "${env:NONEXISTENT_VAR_12345}",
+                "/tmp",
+                "${env:NONEXISTENT_VAR_12345}",
+                id="missing-env-var",
+            ),
+            pytest.param(
+                "${unknown_pattern}", "/tmp", "${unknown_pattern}", id="unknown-variable"
+            ),
+        ],
+    )
+    def test_substitute_string_values(self, value: str, cwd: str, expected: str) -> None:
+        """Test string substitution for known, missing, and unknown variables."""
+        assert substitute_variables(value, Path(cwd)) == expected
 
     def test_substitute_env_var(self) -> None:
         """Test ${env:VAR_NAME} substitution."""
@@ -26,15 +41,6 @@ class TestSubstituteVariables:
         finally:
             del os.environ["TEST_RELDO_VAR"]
 
-    def test_substitute_missing_env_var_unchanged(self) -> None:
-        """Test that missing env var leaves placeholder unchanged."""
-        # Make sure the variable doesn't exist
-        if "NONEXISTENT_VAR_12345" in os.environ:
-            del os.environ["NONEXISTENT_VAR_12345"]
-
-        result = substitute_variables("${env:NONEXISTENT_VAR_12345}", Path("/tmp"))
-        assert result == "${env:NONEXISTENT_VAR_12345}"
-
     def test_substitute_in_list(self) -> None:
         """Test substitution in list values."""
         result = substitute_variables(["${cwd}", "static", "${cwd}/sub"], Path("/my/path"))
@@ -68,11 +74,6 @@ class TestSubstituteVariables:
         assert substitute_variables(True, Path("/tmp")) is True
         assert substitute_variables(None, Path("/tmp")) is None
 
-    def test_substitute_unknown_variable_unchanged(self) -> None:
-        """Test that unknown variables are left unchanged."""
-        result = substitute_variables("${unknown_pattern}", Path("/tmp"))
-        assert result == "${unknown_pattern}"
-
     def test_multiple_substitutions_in_string(self) -> None:
         """Test multiple substitutions in same string."""
         os.environ["TEST_VAR_A"] = "aaa"
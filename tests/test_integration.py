@@ -34,7 +34,6 @@ class TestReldoIntegrationWithAPI:
         """Get path to example config."""
         return project_root / ".claude" / "reldo.json"
 
-    @pytest.mark.asyncio
     async def test_review_with_example_config(
         self, project_root: Path, example_config_path: Path
     ) -> None:
@@ -69,7 +68,6 @@ class TestReldoIntegrationWithAPI:
         # Should have some token usage
         assert result.total_tokens > 0
 
-    @pytest.mark.asyncio
     async def test_review_with_inline_config(self, project_root: Path) -> None:
         """Test running a review with inline config."""
         config = ReviewConfig(
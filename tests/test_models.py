@@ -1,7 +1,6 @@
 """Unit tests for Reldo models."""
 
 import json
-import tempfile
 from datetime import datetime
 from pathlib import Path
 
@@ -10,25 +9,29 @@ import pytest
 from reldo.models import ReviewConfig, ReviewResult, ReviewSession
 
 
-class TestReviewConfig:
-    """Tests for ReviewConfig dataclass."""
+@pytest.fixture(scope="module")
+def base_config_dict() -> dict:
+    """Baseline config dict built once per module; tests mutate a local copy."""
+    return {"prompt": "You are a reviewer", "allowed_tools": ["Read", "Glob"]}
 
-    def test_from_dict_minimal(self) -> None:
-        """Test creating config with only required field."""
-        config = ReviewConfig.from_dict({"prompt": "You are a reviewer"})
 
-        assert config.prompt == "You are a reviewer"
-        assert config.allowed_tools == ["Read", "Glob", "Grep", "Bash", "Task"]
-        assert config.mcp_servers == {}
-        assert config.agents == {}
-        assert config.output_schema is None
-        assert config.timeout_seconds == 180
-        assert config.model == "claude-sonnet-4-20250514"
-        assert config.logging["enabled"] is True
-
-    def test_from_dict_full(self) -> None:
-        """Test creating config with all fields."""
-        data = {
+FROM_DICT_CASES = [
+    pytest.param(
+        {"prompt": "You are a reviewer"},
+        {
+            "prompt": "You are a reviewer",
+            "allowed_tools": ["Read", "Glob", "Grep", "Bash", "Task"],
+            "mcp_servers": {},
+            "agents": {},
+            "output_schema": None,
+            "timeout_seconds": 180,
+            "model": "claude-sonnet-4-20250514",
+            "logging": {"enabled": True, "output_dir": ".reldo", "verbose": False},
+        },
+        id="minimal-defaults",
+    ),
+    pytest.param(
+        {
             "prompt": "You are a reviewer",
             "allowed_tools": ["Read", "Glob"],
             "mcp_servers": {
@@ -46,48 +49,62 @@ class TestReviewConfig:
             "timeout_seconds": 60,
             "model": "claude-opus-4-20250514",
             "logging": {"enabled": False, "verbose": True}
-        }
+        },
+        {
+            "prompt": "You are a reviewer",
+            "allowed_tools": ["Read", "Glob"],
+            "mcp_servers": {"test": {"command": "echo", "args": ["hello"]}},
+            "agents": {
+                "test-agent": {
+                    "description": "Test agent",
+                    "prompt": "You are a test agent",
+                    "tools": ["Read"],
+                }
+            },
+            "output_schema": {
+                "type": "object",
+                "properties": {"passed": {"type": "boolean"}},
+            },
+            "cwd": Path("/tmp"),
+            "timeout_seconds": 60,
+            "model": "claude-opus-4-20250514",
+            "logging": {"enabled": False, "output_dir": ".reldo", "verbose": True},
+        },
+        id="all-fields",
+    ),
+    pytest.param(
+        {"prompt": "test", "cwd": "/some/path"},
+        {"cwd": Path("/some/path")},
+        id="cwd-converted-to-path",
+    ),
+    pytest.param(
+        {"prompt": "test", "logging": {"verbose": True}},
+        {"logging": {"enabled": True, "output_dir": ".reldo", "verbose": True}},
+        id="logging-defaults-merged",
+    ),
+]
+
+
+class TestReviewConfig:
+    """Tests for ReviewConfig dataclass."""
 
+    @pytest.mark.parametrize(("data", "expected"), FROM_DICT_CASES)
+    def test_from_dict(self, data: dict, expected: dict) -> None:
+        """Test from_dict field handling across minimal/full/override inputs."""
         config = ReviewConfig.from_dict(data)
 
-        assert config.prompt == "You are a reviewer"
-        assert config.allowed_tools == ["Read", "Glob"]
-        assert "test" in config.mcp_servers
-        assert "test-agent" in config.agents
-        assert config.agents["test-agent"]["description"] == "Test agent"
-        assert config.output_schema is not None
-        assert config.output_schema["type"] == "object"
-        assert config.cwd == Path("/tmp")
-        assert config.timeout_seconds == 60
-        assert config.model == "claude-opus-4-20250514"
-        assert config.logging["enabled"] is False
-        assert config.logging["verbose"] is True
+        for name, value in expected.items():
+            assert getattr(config, name) == value
 
     def test_from_dict_missing_prompt_raises(self) -> None:
         """Test that missing prompt raises ValueError."""
         with pytest.raises(ValueError, match="must include 'prompt'"):
             ReviewConfig.from_dict({})
 
-    def test_from_dict_cwd_converted_to_path(self) -> None:
-        """Test that cwd string is converted to Path."""
-        config = ReviewConfig.from_dict({"prompt": "test", "cwd": "/some/path"})
-        assert isinstance(config.cwd, Path)
-        assert config.cwd == Path("/some/path")
-
-    def test_from_dict_logging_defaults_merged(self) -> None:
-        """Test that logging config merges with defaults."""
-        config = ReviewConfig.from_dict({"prompt": "test", "logging": {"verbose": True}})
-
-        # Should have default enabled and output_dir, plus our override
-        assert config.logging["enabled"] is True
-        assert config.logging["output_dir"] == ".reldo"
-        assert config.logging["verbose"] is True
-
-    def test_from_file(self) -> None:
+    def test_from_file(self, tmp_path: Path, base_config_dict: dict) -> None:
         """Test loading config from JSON file."""
         config_data = {
-            "prompt": "You are a reviewer",
-            "allowed_tools": ["Read", "Glob"],
+            **base_config_dict,
             "agents": {
                 "test-agent": {
                     "description": "Test agent",
@@ -99,49 +116,35 @@ class TestReviewConfig:
             "timeout_seconds": 60
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(config_data, f)
-            f.flush()
-            temp_path = Path(f.name)
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps(config_data), encoding="utf-8")
 
-        try:
-            config = ReviewConfig.from_file(temp_path)
+        config = ReviewConfig.from_file(config_file)
 
-            assert config.prompt == "You are a reviewer"
-            assert config.allowed_tools == ["Read", "Glob"]
-            assert "test-agent" in config.agents
-            assert config.timeout_seconds == 60
-        finally:
-            temp_path.unlink()
+        assert config.prompt == "You are a reviewer"
+        assert config.allowed_tools == ["Read", "Glob"]
+        assert "test-agent" in config.agents
+        assert config.timeout_seconds == 60
 
     def test_from_file_not_found_raises(self) -> None:
         """Test that missing file raises FileNotFoundError."""
         with pytest.raises(FileNotFoundError, match="Config file not found"):
             ReviewConfig.from_file("/nonexistent/path/config.json")
 
-    def test_from_file_invalid_json_raises(self) -> None:
+    def test_from_file_invalid_json_raises(self, tmp_path: Path) -> None:
         """Test that invalid JSON raises JSONDecodeError."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            f.write("not valid json {")
-            f.flush()
-            temp_path = Path(f.name)
-
-        try:
-            with pytest.raises(json.JSONDecodeError):
-                ReviewConfig.from_file(temp_path)
-        finally:
-            temp_path.unlink()
-
-    def test_direct_instantiation(self) -> None:
+        config_file = tmp_path / "config.json"
+        config_file.write_text("not valid json {", encoding="utf-8")
+
+        with pytest.raises(json.JSONDecodeError):
+            ReviewConfig.from_file(config_file)
+
+    def test_direct_instantiation(self, base_config_dict: dict) -> None:
         """Test creating config directly."""
-        config = ReviewConfig(
-            prompt="You are a reviewer",
-            allowed_tools=["Read"],
-            cwd=Path("/tmp")
-        )
+        config = ReviewConfig(**base_config_dict, cwd=Path("/tmp"))
 
         assert config.prompt == "You are a reviewer"
-        assert config.allowed_tools == ["Read"]
+        assert config.allowed_tools == ["Read", "Glob"]
         assert config.cwd == Path("/tmp")
 
 
@@ -1,34 +1,29 @@
 """Integration tests for main Reldo class."""
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
+from types import ModuleType
 from typing import Any, AsyncIterator
-from unittest.mock import patch
 
 import pytest
 
-from importlib import import_module
+from reldo import Reldo, ReviewConfig, ReviewResult
 
-from reldo import Reldo, ReviewConfig, ReviewResult, HookMatcher
 
-
-# Import the ReviewService module for patching
-review_service_module = import_module("reldo.services.ReviewService")
-
-
-@dataclass
+@dataclass(slots=True)
 class MockTextBlock:
     """Mock text block for message content."""
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MockMessage:
     """Mock message from SDK."""
-    content: list[Any]
+    content: tuple[Any, ...]
 
 
-@dataclass
+@dataclass(slots=True)
 class MockResultMessage:
     """Mock ResultMessage from SDK."""
     subtype: str = "success"
@@ -46,28 +41,36 @@ class MockResultMessage:
             self.usage = {"input_tokens": 1000, "output_tokens": 500}
 
 
+# Result messages are constant across runs; build them once at import
+# instead of per test
+PASS_RESULT = MockResultMessage(
+    result="Review complete. PASS.",
+    usage={"input_tokens": 100, "output_tokens": 50},
+    total_cost_usd=0.001,
+    duration_ms=3000,
+)
+FILE_CONFIG_RESULT = MockResultMessage(
+    result="PASS: No issues found.",
+    usage={"input_tokens": 500, "output_tokens": 200},
+    total_cost_usd=0.002,
+    duration_ms=8000,
+)
+DONE_RESULT = MockResultMessage(result="Done")
+
+
 class TestReldoExports:
     """Tests for public API exports."""
 
-    def test_reldo_class_exported(self) -> None:
-        """Test that Reldo class is exported."""
-        assert Reldo is not None
+    @pytest.mark.parametrize("name", ["Reldo", "ReviewConfig", "ReviewResult", "HookMatcher"])
+    def test_public_export(self, name: str) -> None:
+        """Test that each public name is exported.
 
-    def test_review_config_exported(self) -> None:
-        """Test that ReviewConfig is exported."""
-        assert ReviewConfig is not None
+        HookMatcher may be None without the SDK installed; the export
+        itself must still exist.
+        """
+        import reldo
 
-    def test_review_result_exported(self) -> None:
-        """Test that ReviewResult is exported."""
-        assert ReviewResult is not None
-
-    def test_hook_matcher_exported(self) -> None:
-        """Test that HookMatcher is exported (may be None if SDK not installed)."""
-        # HookMatcher should be available when SDK is installed
-        # May be None in test environment without SDK
-        from reldo import HookMatcher
-        # Just check it's exported, even if None
-        pass
+        assert hasattr(reldo, name)
 
 
 class TestReldoInit:
@@ -106,46 +109,37 @@ class TestReldoInit:
 class TestReldoReview:
     """Tests for Reldo.review() method."""
 
-    @pytest.mark.asyncio
-    async def test_review_returns_result(self) -> None:
+    async def test_review_returns_result(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        aiter_of: Callable[..., Any],
+        review_service_module: ModuleType,
+        reldo_instance: Reldo,
+    ) -> None:
         """Test that review() returns ReviewResult."""
-        mock_result = MockResultMessage(
-            result="Review complete. PASS.",
-            usage={"input_tokens": 100, "output_tokens": 50},
-            total_cost_usd=0.001,
-            duration_ms=3000,
-        )
-
-        async def mock_query_gen() -> AsyncIterator[Any]:
-            yield mock_result
-
-        config = ReviewConfig(prompt="You are a reviewer")
-        reldo = Reldo(config=config)
-
-        with patch.object(review_service_module, "query", return_value=mock_query_gen()):
-            result = await reldo.review("Review app/Models/User.php")
+        monkeypatch.setattr(review_service_module, "query", lambda *a, **k: aiter_of(PASS_RESULT))
+        result = await reldo_instance.review("Review app/Models/User.php")
 
         assert isinstance(result, ReviewResult)
         assert result.text == "Review complete. PASS."
         assert result.total_tokens == 150
 
-    @pytest.mark.asyncio
-    async def test_review_passes_prompt_through(self) -> None:
+    async def test_review_passes_prompt_through(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        aiter_of: Callable[..., Any],
+        review_service_module: ModuleType,
+        reldo_instance: Reldo,
+    ) -> None:
         """Test that review() passes prompt to SDK."""
         captured_prompts: list[str] = []
 
-        async def mock_query_gen() -> AsyncIterator[Any]:
-            yield MockResultMessage(result="Done")
-
         def mock_query(prompt: str, **kwargs: Any) -> AsyncIterator[Any]:
             captured_prompts.append(prompt)
-            return mock_query_gen()
+            return aiter_of(DONE_RESULT)
 
-        config = ReviewConfig(prompt="test")
-        reldo = Reldo(config=config)
-
-        with patch.object(review_service_module, "query", side_effect=mock_query):
-            await reldo.review("Review this specific file")
+        monkeypatch.setattr(review_service_module, "query", mock_query)
+        await reldo_instance.review("Review this specific file")
 
         assert len(captured_prompts) == 1
         assert captured_prompts[0] == "Review this specific file"
@@ -154,46 +148,43 @@ class TestReldoReview:
 class TestReldoIntegration:
     """Integration-style tests for full Reldo flow."""
 
-    @pytest.mark.asyncio
-    async def test_full_flow_with_file_config(self) -> None:
-        """Test complete flow with file-based config."""
-        import tempfile
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create config file
-            config_file = Path(tmpdir) / "reldo.json"
-            config_file.write_text("""{
-                "prompt": "You are a code reviewer",
-                "allowed_tools": ["Read", "Glob", "Grep"],
-                "cwd": "/tmp"
-            }""", encoding="utf-8")
-
-            # Load config from file
-            config = ReviewConfig.from_file(config_file)
-
-            # Create Reldo instance
-            reldo = Reldo(config=config)
-
-            # Mock SDK response
-            mock_result = MockResultMessage(
-                result="PASS: No issues found.",
-                usage={"input_tokens": 500, "output_tokens": 200},
-                total_cost_usd=0.002,
-                duration_ms=8000,
-            )
-
-            async def mock_query_gen() -> AsyncIterator[Any]:
-                yield mock_result
-
-            with patch.object(review_service_module, "query", return_value=mock_query_gen()):
-                result = await reldo.review("Review app/Models/User.php")
-
-            assert "PASS" in result.text
-            assert result.total_tokens == 700
-            assert result.total_cost_usd == 0.002
-
-    @pytest.mark.asyncio
-    async def test_full_flow_with_hooks(self) -> None:
+    def test_from_file_parses_json(self, loaded_reldo_json_config: ReviewConfig) -> None:
+        """Test that the file-based config parses into the expected fields."""
+        assert loaded_reldo_json_config.prompt == "You are a code reviewer"
+        assert loaded_reldo_json_config.allowed_tools == ["Read", "Glob", "Grep"]
+        assert loaded_reldo_json_config.cwd == Path("/tmp")
+
+    async def test_full_flow_with_loaded_config(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        base_config: ReviewConfig,
+        aiter_of: Callable[..., Any],
+        review_service_module: ModuleType,
+    ) -> None:
+        """Test complete flow with an already-constructed config.
+
+        JSON parsing is covered by test_from_file_parses_json; this test
+        only exercises the downstream review flow, so it takes the
+        in-memory config and never touches disk.
+        """
+        reldo = Reldo(config=base_config)
+
+        # Mock SDK response
+        monkeypatch.setattr(
+            review_service_module, "query", lambda *a, **k: aiter_of(FILE_CONFIG_RESULT)
+        )
+        result = await reldo.review("Review app/Models/User.php")
+
+        assert "PASS" in result.text
+        assert result.total_tokens == 700
+        assert result.total_cost_usd == 0.002
+
+    async def test_full_flow_with_hooks(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        aiter_of: Callable[..., Any],
+        review_service_module: ModuleType,
+    ) -> None:
         """Test complete flow with programmatic hooks."""
         hook_calls: list[str] = []
 
@@ -204,13 +195,8 @@ class TestReldoIntegration:
         config = ReviewConfig(prompt="test reviewer")
         reldo = Reldo(config=config, hooks={"PreToolUse": [pre_tool_hook]})
 
-        mock_result = MockResultMessage(result="Done")
-
-        async def mock_query_gen() -> AsyncIterator[Any]:
-            yield mock_result
-
-        with patch.object(review_service_module, "query", return_value=mock_query_gen()):
-            result = await reldo.review("Quick review")
+        monkeypatch.setattr(review_service_module, "query", lambda *a, **k: aiter_of(DONE_RESULT))
+        result = await reldo.review("Quick review")
 
         # Hooks are passed to SDK, not called directly in our code
         # So we verify the service has the hooks configured